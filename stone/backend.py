@@ -5,6 +5,7 @@ import os
 import textwrap
 from abc import ABCMeta, abstractmethod
 from contextlib import contextmanager
+from functools import lru_cache
 
 from stone.frontend.ir_generator import doc_ref_re
 from stone.ir import (
@@ -24,6 +25,18 @@ if _MYPY:
     V = typing.TypeVar('V')
 
 
+@lru_cache(maxsize=4096)
+def _fill(s, initial_indent, subsequent_indent, width, break_long_words, break_on_hyphens):
+    # Boilerplate docs recur across fields and types, so wrap each
+    # (text, layout) combination only once.
+    return textwrap.fill(s,
+                         initial_indent=initial_indent,
+                         subsequent_indent=subsequent_indent,
+                         width=width,
+                         break_long_words=break_long_words,
+                         break_on_hyphens=break_on_hyphens)
+
+
 def remove_aliases_from_api(api):
     # Resolve nested aliases from each namespace first. This way, when we replace an alias with
     # its source later on, it too is alias free.
@@ -112,6 +125,8 @@ class Backend(metaclass=ABCMeta):
         self.output = []  # type: typing.List[typing.Text]
         self.lineno = 1
         self.cur_indent = 0
+        # Indentation strings indexed by level, grown on demand.
+        self._indents = ['']  # type: typing.List[typing.Text]
         self.positional_placeholders = []  # type: typing.List[typing.Text]
         self.named_placeholders = {}  # type: typing.Dict[typing.Text, typing.Text]
 
@@ -204,10 +219,10 @@ class Backend(metaclass=ABCMeta):
         either spaces or tabs, depending on the value of the class variable
         tabs_for_indents.
         """
-        if self.tabs_for_indents:
-            return '\t' * self.cur_indent
-        else:
-            return ' ' * self.cur_indent
+        indents = self._indents
+        while len(indents) <= self.cur_indent:
+            indents.append(indents[-1] + ('\t' if self.tabs_for_indents else ' '))
+        return indents[self.cur_indent]
 
     @contextmanager
     def capture_emitted_output(self, output_buffer):
@@ -245,10 +260,38 @@ class Backend(metaclass=ABCMeta):
         assert isinstance(s, str), 's must be a unicode string'
         assert '\n' not in s, \
             'String to emit cannot contain newline strings.'
+        # Equivalent to emit_raw(), minus the newline counting and trailing
+        # newline check, which are known to hold for a single line.
+        self.lineno += 1
         if s:
-            self.emit_raw('{}{}\n'.format(self.make_indent(), s))
+            self._append_output('{}{}\n'.format(
+                self.make_indent(), s.replace('{', '{{').replace('}', '}}')))
         else:
-            self.emit_raw('\n')
+            self._append_output('\n')
+
+    def emit_section_break(self, n=1):
+        # type: (int) -> None
+        """
+        Adds n empty lines to the output buffer with a single call. Like
+        :meth:`emit` with no arguments, the lines have no indentation.
+        """
+        self.emit_raw('\n' * n)
+
+    def emit_lines(self, lines):
+        # type: (typing.Iterable[typing.Text]) -> None
+        """
+        Emits each string in lines as :meth:`emit` would, but computes the
+        indentation once and adds all of them to the output buffer at once.
+        """
+        indent = self.make_indent()
+        parts = []
+        for s in lines:
+            assert isinstance(s, str), 's must be a unicode string'
+            assert '\n' not in s, \
+                'String to emit cannot contain newline strings.'
+            parts.append(indent + s + '\n' if s else '\n')
+        if parts:
+            self.emit_raw(''.join(parts))
 
     def emit_wrapped_text(
             self,
@@ -287,13 +330,12 @@ class Backend(metaclass=ABCMeta):
         indent = self.make_indent()
         prefix = indent + prefix
 
-        self.emit_raw(textwrap.fill(s,
-                                    initial_indent=prefix + initial_prefix,
-                                    subsequent_indent=prefix + subsequent_prefix,
-                                    width=width,
-                                    break_long_words=break_long_words,
-                                    break_on_hyphens=break_on_hyphens,
-                                    ) + '\n')
+        self.emit_raw(_fill(s,
+                            prefix + initial_prefix,
+                            prefix + subsequent_prefix,
+                            width,
+                            break_long_words,
+                            break_on_hyphens) + '\n')
 
     def emit_placeholder(self, s=''):
         # type: (typing.Text) -> None
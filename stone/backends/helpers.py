@@ -1,4 +1,5 @@
 import re
+from functools import lru_cache
 
 _split_words_capitalization_re = re.compile(
     '^[a-z0-9]+|[A-Z][a-z0-9]+|[A-Z]+(?=[A-Z][a-z0-9])|[A-Z]+$'
@@ -13,7 +14,7 @@ def split_words(name):
         Example: 'get_file' -> ['get', 'file']
     """
     all_words = []
-    for word in re.split(_split_words_dashes_re, name):
+    for word in _split_words_dashes_re.split(name):
         vals = _split_words_capitalization_re.findall(word)
         if vals:
             all_words.extend(vals)
@@ -22,6 +23,7 @@ def split_words(name):
     return all_words
 
 
+@lru_cache(maxsize=4096)
 def fmt_camel(name):
     """
     Converts name to lower camel case. Words are identified by capitalization,
@@ -33,6 +35,7 @@ def fmt_camel(name):
     return first + ''.join([word.capitalize() for word in words])
 
 
+@lru_cache(maxsize=4096)
 def fmt_dashes(name):
     """
     Converts name to words separated by dashes. Words are identified by
@@ -41,6 +44,7 @@ def fmt_dashes(name):
     return '-'.join([word.lower() for word in split_words(name)])
 
 
+@lru_cache(maxsize=4096)
 def fmt_pascal(name):
     """
     Converts name to pascal case. Words are identified by capitalization,
@@ -49,6 +53,7 @@ def fmt_pascal(name):
     return ''.join([word.capitalize() for word in split_words(name)])
 
 
+@lru_cache(maxsize=4096)
 def fmt_underscores(name):
     """
     Converts name to words separated by underscores. Words are identified by
@@ -275,7 +275,5 @@ class ObjCBaseBackend(CodeBackend):
 
     def _struct_has_defaults(self, struct):
         """Returns whether the given struct has any default values."""
-        return [
-            f for f in struct.all_fields
-            if f.has_default or is_nullable_type(f.data_type)
-        ]
+        return any(f.has_default or is_nullable_type(f.data_type)
+                   for f in struct.all_fields)
@@ -100,10 +100,10 @@ class ObjCBackend(ObjCBaseBackend):
                         self.namespace_to_has_routes[namespace] = True
                         break
 
-        for namespace in api.namespaces.values():
-            for data_type in namespace.linearize_data_types():
-                self.obj_name_to_namespace[data_type.name] = fmt_class_prefix(
-                    data_type)
+        self.obj_name_to_namespace.update(
+            (data_type.name, fmt_class_prefix(data_type))
+            for namespace in api.namespaces.values()
+            for data_type in namespace.linearize_data_types())
 
         for namespace in api.namespaces.values():
             if namespace.routes and self.namespace_to_has_routes[namespace]:
@@ -1,5 +1,7 @@
 import pprint
 
+from functools import lru_cache
+
 from stone.ir import (
     Boolean,
     Bytes,
@@ -170,9 +172,12 @@ def fmt_obj(o):
         return 'false'
     if o is None:
         return 'nil'
+    if isinstance(o, (int, float)):
+        return repr(o)
     return pprint.pformat(o, width=1)
 
 
+@lru_cache(maxsize=4096)
 def fmt_camel(name, upper_first=False, reserved=True):
     name = str(name)
     words = [word.capitalize() for word in split_words(name)]
@@ -192,6 +197,7 @@ def fmt_camel(name, upper_first=False, reserved=True):
     return ret
 
 
+@lru_cache(maxsize=4096)
 def fmt_enum_name(field_name, union):
     return 'DB{}{}{}'.format(
         fmt_class_caps(union.namespace.name),
@@ -220,8 +226,9 @@ def fmt_class_type(data_type, suppress_ptr=False):
     if is_user_defined_type(data_type):
         result = '{}'.format(fmt_class_prefix(data_type))
     else:
-        result = _primitive_table.get(data_type.__class__,
-                                      fmt_class(data_type.name))
+        result = _primitive_table.get(data_type.__class__)
+        if result is None:
+            result = fmt_class(data_type.name)
 
         if suppress_ptr:
             result = result.replace(' *', '')
@@ -247,8 +254,9 @@ def fmt_type(data_type, tag=False, has_default=False, no_ptr=False, is_prop=Fals
         base = '{}' if no_ptr else '{} *'
         result = base.format(fmt_class_prefix(data_type))
     else:
-        result = _primitive_table.get(data_type.__class__,
-                                      fmt_class(data_type.name))
+        result = _primitive_table.get(data_type.__class__)
+        if result is None:
+            result = fmt_class(data_type.name)
 
         if is_list_type(data_type):
             data_type, _ = unwrap_nullable(data_type.data_type)
@@ -296,8 +304,12 @@ def fmt_class_prefix(data_type):
         fmt_class_caps(data_type.namespace.name), fmt_class(data_type.name))
 
 
+@lru_cache(maxsize=4096)
 def fmt_validator(data_type):
-    return _validator_table.get(data_type.__class__, fmt_class(data_type.name))
+    result = _validator_table.get(data_type.__class__)
+    if result is None:
+        result = fmt_class(data_type.name)
+    return result
 
 
 def fmt_serial_obj(data_type):
@@ -306,8 +318,9 @@ def fmt_serial_obj(data_type):
     if is_user_defined_type(data_type):
         result = fmt_serial_class(fmt_class_prefix(data_type))
     else:
-        result = _serial_table.get(data_type.__class__,
-                                   fmt_class(data_type.name))
+        result = _serial_table.get(data_type.__class__)
+        if result is None:
+            result = fmt_class(data_type.name)
 
     return result
 
@@ -444,6 +457,7 @@ def fmt_signature(func, args, return_type='void', class_func=False):
     return result
 
 
+@lru_cache(maxsize=4096)
 def is_primitive_type(data_type):
     data_type, _ = unwrap_nullable(data_type)
     return data_type.__class__ in _wrapper_primitives
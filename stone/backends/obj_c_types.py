@@ -1,3 +1,4 @@
+import collections
 import json
 import os
 import shutil
@@ -77,6 +78,62 @@ _cmdline_parser.add_argument(
     help=('Sets whether generated code should marked for exclusion ' +
         'from analysis.'), )
 
+# Runtime sources from obj_c_rsrc that are copied into the output folder.
+_rsrc_file_names = (
+    'DBStoneValidators.h',
+    'DBStoneValidators.m',
+    'DBStoneSerializers.h',
+    'DBStoneSerializers.m',
+    'DBStoneBase.h',
+    'DBStoneBase.m',
+    'DBSerializableProtocol.h',
+)
+
+
+_FieldInfo = collections.namedtuple(
+    '_FieldInfo',
+    ['name', 'is_nullable', 'is_void', 'has_default', 'default', 'type_str',
+     'validator_str'])
+
+
+# Calls into the DBStoneValidators runtime class, i.e. what fmt_func_call
+# returns for caller='DBStoneValidators' and the given callee.
+_validator_call = '[DBStoneValidators {}]'
+_nullable_validator_call = '[DBStoneValidators nullableValidator:{}]'
+_nonnull_validator_call = '[DBStoneValidators nonnullValidator:{}]'
+
+_throw_exc = '@throw([NSException exceptionWithName:@"{}" reason:{} userInfo:nil]);'
+
+# Reason given by deserializers when `valueDict` has an unrecognized tag.
+_invalid_tag_reason = (
+    '[NSString stringWithFormat:@"Tag has an invalid value: \\\"%@\\\".", '
+    'valueDict[@".tag"]]')
+
+# Statements adding a serialized field `value` to the `jsonDict` being built by
+# the generated serialize methods. Fields of struct types without enumerated
+# subtypes are flattened into a union's dictionary; other user-defined types
+# are nested.
+_json_dict_entries = {
+    'value': 'jsonDict[@"{key}"] = {value};',
+    'nested': 'jsonDict[@"{key}"] = [{value} mutableCopy];',
+    'flattened': '[jsonDict addEntriesFromDictionary:{value}];',
+}
+
+# Lines emitted for a single field, keyed by the kind of entry and whether the
+# field is nullable, in which case it is only added when set. Indentation is
+# relative to the method body.
+_json_dict_entry_lines = {
+    (kind, nullable): (('if ({input_value}) {{', '    ' + entry, '}}')
+                       if nullable else (entry,))
+    for kind, entry in _json_dict_entries.items()
+    for nullable in (False, True)
+}
+
+
+def _fmt_boxed_or_nil(value):
+    """Returns `value` as a boxed Obj C literal, or `nil` if it is unset."""
+    return '@({})'.format(value) if value else 'nil'
+
 
 class ObjCTypesBackend(ObjCBaseBackend):
     """Generates Obj C modules to represent the input Stone spec."""
@@ -85,6 +142,17 @@ class ObjCTypesBackend(ObjCBaseBackend):
     obj_name_to_namespace = {}  # type: typing.Dict[str, str]
     namespace_to_has_route_auth_list = {}  # type: typing.Dict[typing.Any, typing.Set]
 
+    def __init__(self, *args, **kwargs):
+        # type: (...) -> None
+        super().__init__(*args, **kwargs)
+        self._partition_cache = {}  # type: typing.Dict[typing.Any, typing.Tuple]
+        self._field_info_cache = {}  # type: typing.Dict[typing.Any, _FieldInfo]
+        self._sig_cache = {}  # type: typing.Dict[typing.Tuple, str]
+        self._ser_cache = {}  # type: typing.Dict[typing.Tuple, str]
+        self._subtype_cache = {}  # type: typing.Dict[typing.Any, typing.List]
+        self._linearized_cache = {}  # type: typing.Dict[typing.Any, typing.List]
+        self._string_validator_cache = {}  # type: typing.Dict[typing.Any, str]
+
     def generate(self, api):
         """
         Generates a module for each namespace.
@@ -95,32 +163,11 @@ class ObjCTypesBackend(ObjCBaseBackend):
         rsrc_folder = os.path.join(os.path.dirname(__file__), 'obj_c_rsrc')
         rsrc_output_folder = os.path.join(self.target_folder_path, 'Resources')
 
-        if not os.path.exists(rsrc_output_folder):
-            os.makedirs(rsrc_output_folder)
-
-        self.logger.info('Copying DBStoneValidators.{h,m} to output folder')
-        shutil.copy(
-            os.path.join(rsrc_folder, 'DBStoneValidators.h'),
-            rsrc_output_folder)
-        shutil.copy(
-            os.path.join(rsrc_folder, 'DBStoneValidators.m'),
-            rsrc_output_folder)
-        self.logger.info('Copying DBStoneSerializers.{h,m} to output folder')
-        shutil.copy(
-            os.path.join(rsrc_folder, 'DBStoneSerializers.h'),
-            rsrc_output_folder)
-        shutil.copy(
-            os.path.join(rsrc_folder, 'DBStoneSerializers.m'),
-            rsrc_output_folder)
-        self.logger.info('Copying DBStoneBase.{h,m} to output folder')
-        shutil.copy(
-            os.path.join(rsrc_folder, 'DBStoneBase.h'), rsrc_output_folder)
-        shutil.copy(
-            os.path.join(rsrc_folder, 'DBStoneBase.m'), rsrc_output_folder)
-        self.logger.info('Copying DBSerializableProtocol.h to output folder')
-        shutil.copy(
-            os.path.join(rsrc_folder, 'DBSerializableProtocol.h'),
-            rsrc_output_folder)
+        os.makedirs(rsrc_output_folder, exist_ok=True)
+
+        self.logger.info('Copying obj_c_rsrc runtime files to output folder')
+        for file_name in _rsrc_file_names:
+            shutil.copy(os.path.join(rsrc_folder, file_name), rsrc_output_folder)
 
         jazzy_cfg = None
 
@@ -149,10 +196,10 @@ class ObjCTypesBackend(ObjCBaseBackend):
         with self.output_to_relative_path('DBSDKImportsGenerated.h'):
             self._generate_all_imports(api)
 
-        for namespace in api.namespaces.values():
-            for data_type in namespace.linearize_data_types():
-                self.obj_name_to_namespace[data_type.name] = fmt_class_prefix(
-                    data_type)
+        self.obj_name_to_namespace.update(
+            (data_type.name, fmt_class_prefix(data_type))
+            for namespace in api.namespaces.values()
+            for data_type in self._namespace_data_types(namespace))
 
         for namespace in api.namespaces.values():
             ns_name = fmt_public_name(namespace.name)
@@ -175,31 +222,47 @@ class ObjCTypesBackend(ObjCBaseBackend):
 
     def _generate_all_imports(self, api):
         self.emit_raw(base_file_comment)
+        self.emit_raw(self._build_imports_body(api))
 
-        self.emit('/// Import autogenerated files')
-        self.emit()
-
-        self.emit('// Routes')
+    def _build_imports_body(self, api):
+        """Returns the body of the umbrella imports header as a single string,
+        so that it is written with one buffered call rather than line by line."""
+        lines = ['/// Import autogenerated files', '', '// Routes']
         for namespace in api.namespaces.values():
             if namespace.routes:
                 for auth_type in self.namespace_to_has_route_auth_list[
                         namespace]:
-                    self.emit(
+                    lines.append(
                         fmt_import(
                             fmt_routes_class(namespace.name, auth_type)))
-                self.emit(fmt_import(fmt_route_obj_class(namespace.name)))
-        self.emit()
+                lines.append(fmt_import(fmt_route_obj_class(namespace.name)))
+        lines.append('')
 
         for namespace in api.namespaces.values():
-            namespace_imports = []
-            self.emit()
-            self.emit(
+            lines.append('')
+            lines.append(
                 '// `{}` namespace types'.format(fmt_class(namespace.name)))
-            self.emit()
-            for data_type in namespace.linearize_data_types():
-                namespace_imports.append(fmt_class_prefix(data_type))
-
-            self._generate_imports_m(namespace_imports)
+            lines.append('')
+            namespace_imports = {
+                fmt_class_prefix(data_type)
+                for data_type in self._namespace_data_types(namespace)
+            }
+            lines.extend(
+                fmt_import(import_class)
+                for import_class in sorted(namespace_imports))
+            lines.append('')
+
+        return '\n'.join(lines) + '\n'
+
+    def _namespace_data_types(self, namespace):
+        """Returns the linearized data types of the namespace. The result is
+        cached, since the imports header, the class name map, the headers and
+        the implementation file each walk it."""
+        try:
+            return self._linearized_cache[namespace]
+        except KeyError:
+            result = self._linearized_cache[namespace] = namespace.linearize_data_types()
+            return result
 
     def _generate_namespace_types(self, namespace, jazzy_cfg):
         """Creates Obj C argument, error, serializer and deserializer types
@@ -208,7 +271,7 @@ class ObjCTypesBackend(ObjCBaseBackend):
         output_path = os.path.join('ApiObjects', ns_name)
         output_path_headers = os.path.join(output_path, 'Headers')
 
-        for data_type in namespace.linearize_data_types():
+        for data_type in self._namespace_data_types(namespace):
             class_name = fmt_class_prefix(data_type)
 
             if self.args.documentation:
@@ -251,7 +314,7 @@ class ObjCTypesBackend(ObjCBaseBackend):
                 self.emit()
                 self.emit('#ifndef __clang_analyzer__')
 
-            for data_type in namespace.linearize_data_types():
+            for data_type in self._namespace_data_types(namespace):
                 if is_struct_type(data_type):
                     # struct implementation
                     self._generate_struct_class_m(data_type)
@@ -295,8 +358,7 @@ class ObjCTypesBackend(ObjCBaseBackend):
             self.emit()
             self._generate_equality_func(struct)
 
-        self.emit()
-        self.emit()
+        self.emit_section_break(2)
 
         self.emit('#pragma mark - Serializer Object')
         self.emit()
@@ -330,8 +392,7 @@ class ObjCTypesBackend(ObjCBaseBackend):
             self._generate_struct_cstor_signature_default(struct)
             self._generate_init_unavailable_signature(struct)
 
-        self.emit()
-        self.emit()
+        self.emit_section_break(2)
 
         self.emit('#pragma mark - Serializer Object')
         self.emit()
@@ -387,8 +448,7 @@ class ObjCTypesBackend(ObjCBaseBackend):
             self.emit()
             self._generate_equality_func(union)
 
-        self.emit()
-        self.emit()
+        self.emit_section_break(2)
 
         self.emit('#pragma mark - Serializer Object')
         self.emit()
@@ -425,8 +485,7 @@ class ObjCTypesBackend(ObjCBaseBackend):
             self.emit()
             self._generate_union_tag_access_signatures(union)
 
-        self.emit()
-        self.emit()
+        self.emit_section_break(2)
 
         self.emit('#pragma mark - Serializer Object')
         self.emit()
@@ -459,18 +518,18 @@ class ObjCTypesBackend(ObjCBaseBackend):
                 func=self._cstor_name_from_fields(struct.all_fields),
                 args=fmt_func_args_from_fields(struct.all_fields),
                 return_type='instancetype'):
-            for field in struct.all_fields:
-                self._generate_validator(field)
+            for info in map(self._struct_field_info, struct.all_fields):
+                if info.validator_str:
+                    self.emit(info.validator_str)
 
             self.emit()
 
-            super_fields = [
-                f for f in struct.all_fields if f not in struct.fields
-            ]
+            _, super_fields = self._struct_field_partitions(struct)
 
             if super_fields:
-                super_args = fmt_func_args([(fmt_var(f.name), fmt_var(f.name))
-                                            for f in super_fields])
+                super_args = fmt_func_args(
+                    [(info.name, info.name)
+                     for info in map(self._struct_field_info, super_fields)])
                 self.emit('self = [super {}:{}];'.format(
                     self._cstor_name_from_fields(super_fields), super_args))
             else:
@@ -479,33 +538,28 @@ class ObjCTypesBackend(ObjCBaseBackend):
                 else:
                     self.emit('self = [super init];')
             with self.block_init():
-                for field in struct.fields:
-                    field_name = fmt_var(field.name)
-
-                    if field.has_default:
+                for info in map(self._struct_field_info, struct.fields):
+                    if info.has_default:
                         self.emit('_{0} = {0} ?: {1};'.format(
-                            field_name, fmt_default_value(field)))
+                            info.name, info.default))
                     else:
-                        self.emit('_{0} = {0};'.format(field_name))
+                        self.emit('_{0} = {0};'.format(info.name))
         self.emit()
 
     def _generate_struct_cstor_default(self, struct):
         """Emits struct convenience constructor. Default arguments are omitted."""
-        if not self._struct_has_defaults(struct):
+        fields_no_default, _ = self._struct_field_partitions(struct)
+        if len(fields_no_default) == len(struct.all_fields):
+            # No field has a default or is nullable.
             return
 
-        fields_no_default = [
-            f for f in struct.all_fields
-            if not f.has_default and not is_nullable_type(f.data_type)
-        ]
-
         with self.block_func(
                 func=self._cstor_name_from_fields(fields_no_default),
                 args=fmt_func_args_from_fields(fields_no_default),
                 return_type='instancetype'):
-            args = ([(fmt_var(f.name), fmt_var(f.name) if not f.has_default and
-                      not is_nullable_type(f.data_type) else 'nil')
-                     for f in struct.all_fields])
+            args = ([(info.name, info.name if not info.has_default and
+                      not info.is_nullable else 'nil')
+                     for info in map(self._struct_field_info, struct.all_fields)])
             cstor_args = fmt_func_args(args)
             self.emit('return [self {}:{}];'.format(
                 self._cstor_name_from_fields(struct.all_fields), cstor_args))
@@ -517,16 +571,14 @@ class ObjCTypesBackend(ObjCBaseBackend):
         self.emit(comment_prefix)
         description_str = 'Full constructor for the struct (exposes all instance variables).'
         self.emit_wrapped_text(description_str, prefix=comment_prefix)
-        signature = fmt_signature(
-            func=self._cstor_name_from_fields(fields),
-            args=self._cstor_args_from_fields(fields, is_struct=True),
-            return_type='instancetype')
+        signature = self._fmt_cstor_signature(
+            self._cstor_name_from_fields(fields), fields, is_struct=True)
         self.emit(comment_prefix)
         for field in struct.all_fields:
             doc = self.process_doc(field.doc,
                                    self._docf) if field.doc else undocumented
             self.emit_wrapped_text(
-                '@param {} {}'.format(fmt_var(field.name), doc),
+                '@param {} {}'.format(self._struct_field_info(field).name, doc),
                 prefix=comment_prefix)
         if struct.all_fields:
             self.emit(comment_prefix)
@@ -540,18 +592,14 @@ class ObjCTypesBackend(ObjCBaseBackend):
     def _generate_struct_cstor_signature_default(self, struct):
         """Emits struct convenience constructor with default arguments
         ommitted signature to be used in the struct header file."""
-        if not self._struct_has_defaults(struct):
+        fields_no_default, _ = self._struct_field_partitions(struct)
+        if len(fields_no_default) == len(struct.all_fields):
+            # No field has a default or is nullable.
             return
-
-        fields_no_default = [
-            f for f in struct.all_fields
-            if not f.has_default and not is_nullable_type(f.data_type)
-        ]
-        signature = fmt_signature(
-            func=self._cstor_name_from_fields(fields_no_default),
-            args=self._cstor_args_from_fields(
-                fields_no_default, is_struct=True),
-            return_type='instancetype')
+        signature = self._fmt_cstor_signature(
+            self._cstor_name_from_fields(fields_no_default),
+            fields_no_default,
+            is_struct=True)
 
         self.emit(comment_prefix)
         description_str = (
@@ -563,7 +611,7 @@ class ObjCTypesBackend(ObjCBaseBackend):
             doc = self.process_doc(field.doc,
                                    self._docf) if field.doc else undocumented
             self.emit_wrapped_text(
-                '@param {} {}'.format(fmt_var(field.name), doc),
+                '@param {} {}'.format(self._struct_field_info(field).name, doc),
                 prefix=comment_prefix)
         if struct.all_fields:
             self.emit(comment_prefix)
@@ -574,6 +622,86 @@ class ObjCTypesBackend(ObjCBaseBackend):
         self.emit('{};'.format(signature))
         self.emit()
 
+    def _struct_field_partitions(self, struct):
+        """Returns a tuple of the struct's fields that have no default value
+        and are not nullable, and the fields inherited from its parent. The
+        result is cached, since every constructor emitter needs it."""
+        try:
+            return self._partition_cache[struct]
+        except KeyError:
+            pass
+
+        own_fields = set(struct.fields)
+        fields_no_default = []
+        super_fields = []
+        for f in struct.all_fields:
+            info = self._struct_field_info(f)
+            if not info.has_default and not info.is_nullable:
+                fields_no_default.append(f)
+            if f not in own_fields:
+                super_fields.append(f)
+
+        result = (fields_no_default, super_fields)
+        self._partition_cache[struct] = result
+        return result
+
+    def _fmt_json_dict_entry_lines(self, field, input_value, kind, nullable):
+        """Returns the lines of a serialize method that add the given field,
+        read from `input_value`, to `jsonDict` as an entry of the given kind."""
+        value = self._fmt_serialization_call(field.data_type, input_value, True)
+        return [line.format(key=field.name, value=value, input_value=input_value)
+                for line in _json_dict_entry_lines[kind, nullable]]
+
+    def _struct_serializes_as_literal(self, struct):
+        """Returns whether the given struct's serialize method can return a
+        dictionary literal: it has fields, no enumerated subtypes, and every
+        field is a non-nullable primitive that is serialized as-is."""
+        if not struct.all_fields or struct.has_enumerated_subtypes():
+            return False
+        return all(
+            not self._struct_field_info(f).is_nullable and
+            is_primitive_type(f.data_type) for f in struct.all_fields)
+
+    def _struct_subtypes(self, struct):
+        """Returns a list of (tag, class name, serializer class name) tuples
+        for every subtype of the given struct, which must enumerate its
+        subtypes. The result is cached, since both the serializer and the
+        deserializer walk the subtype hierarchy."""
+        try:
+            return self._subtype_cache[struct]
+        except KeyError:
+            pass
+
+        result = []
+        for tags, subtype in struct.get_all_subtypes_with_tags():
+            assert len(tags) == 1, tags
+            subtype_name = fmt_class_prefix(subtype)
+            result.append((tags[0], subtype_name, fmt_serial_class(subtype_name)))
+        self._subtype_cache[struct] = result
+        return result
+
+    def _struct_field_info(self, field):
+        """Returns the formatted name, type predicates and default value of the
+        given struct field, computed once and shared by every emitter."""
+        try:
+            return self._field_info_cache[field]
+        except KeyError:
+            pass
+
+        name = fmt_var(field.name)
+        default = fmt_default_value(field) if field.has_default else None
+        info = _FieldInfo(
+            name=name,
+            is_nullable=is_nullable_type(field.data_type),
+            is_void=is_void_type(field.data_type),
+            has_default=field.has_default,
+            default=default,
+            type_str=fmt_type(
+                field.data_type, tag=True, has_default=field.has_default),
+            validator_str=self._build_validator_str(field, name, default))
+        self._field_info_cache[field] = info
+        return info
+
     def _generate_union_cstor_funcs(self, union):
         """Emits standard union constructor."""
         for field in union.all_fields:
@@ -596,29 +724,24 @@ class ObjCTypesBackend(ObjCBaseBackend):
     def _generate_union_cstor_signatures(self, union, fields):  # pylint: disable=unused-argument
         """Emits union constructor signatures to be used in the union's header file."""
         for field in fields:
-            args = self._cstor_args_from_fields(
+            signature = self._fmt_cstor_signature(
+                self._cstor_name_from_field(field),
                 [field] if not is_void_type(field.data_type) else [])
-            signature = fmt_signature(
-                func=self._cstor_name_from_field(field),
-                args=args,
-                return_type='instancetype')
             self.emit(comment_prefix)
             self.emit_wrapped_text(
                 'Initializes union class with tag state of "{}".'.format(
                     field.name),
                 prefix=comment_prefix)
             self.emit(comment_prefix)
+            doc = self.process_doc(
+                field.doc, self._docf) if field.doc else undocumented
             if field.doc:
-                doc = self.process_doc(
-                    field.doc, self._docf) if field.doc else undocumented
                 self.emit_wrapped_text(
                     'Description of the "{}" tag state: {}'.format(
                         field.name, doc),
                     prefix=comment_prefix)
                 self.emit(comment_prefix)
             if not is_void_type(field.data_type):
-                doc = self.process_doc(
-                    field.doc, self._docf) if field.doc else undocumented
                 self.emit_wrapped_text(
                     '@param {} {}'.format(fmt_var(field.name), doc),
                     prefix=comment_prefix)
@@ -842,26 +965,66 @@ class ObjCTypesBackend(ObjCBaseBackend):
                     field_name, other_obj_name)):
                 self.emit('return NO;')
 
+    def _fmt_cstor_signature(self, func_name, fields, is_struct=False):
+        """Returns the header declaration of the constructor `func_name` taking
+        `fields` as arguments. The result is cached, since union subtypes
+        redeclare the constructors of every inherited tag."""
+        key = (func_name, tuple(fields), is_struct)
+        try:
+            return self._sig_cache[key]
+        except KeyError:
+            pass
+
+        signature = fmt_signature(
+            func=func_name,
+            args=self._cstor_args_from_fields(fields, is_struct=is_struct),
+            return_type='instancetype')
+        self._sig_cache[key] = signature
+        return signature
+
     def _cstor_args_from_fields(self, fields, is_struct=False):
         """Returns a string representing the properly formatted arguments for a constructor."""
         if is_struct:
-            args = [(fmt_var(f.name),
-                fmt_type(f.data_type, tag=True, has_default=f.has_default)) for f in fields]
+            args = [(info.name, info.type_str)
+                    for info in map(self._struct_field_info, fields)]
         else:
             args = [(fmt_var(f.name), fmt_type(f.data_type, tag=True)) for f in fields]
 
         return fmt_func_args_declaration(args)
 
-    def _generate_validator(self, field):
-        """Emits validator if data type has associated validator."""
+    def _build_validator_str(self, field, name, default):
+        """Returns the validation statement for the given struct field, or None
+        if its data type has no associated validator."""
         validator = self._determine_validator_type(field.data_type,
-                                                   fmt_var(field.name),
+                                                   name,
                                                    field.has_default)
-        value = fmt_var(
-            field.name) if not field.has_default else '{} ?: {}'.format(
-                fmt_var(field.name), fmt_default_value(field))
-        if validator:
-            self.emit('{}({});'.format(validator, value))
+        if not validator:
+            return None
+        value = name if not field.has_default else '{} ?: {}'.format(
+            name, default)
+        return '{}({});'.format(validator, value)
+
+    def _fmt_string_validator(self, data_type):
+        """Returns the validator call for a constrained string type. String types
+        are commonly shared by many fields, so the escaped pattern is built once."""
+        try:
+            return self._string_validator_cache[data_type]
+        except KeyError:
+            pass
+
+        pattern = data_type.pattern.encode('unicode_escape').replace(
+            b"\"",
+            b"\\\"") if data_type.pattern else None
+        validator = '{}:{}'.format(
+            fmt_validator(data_type),
+            fmt_func_args([
+                ('minLength', _fmt_boxed_or_nil(data_type.min_length)),
+                ('maxLength', _fmt_boxed_or_nil(data_type.max_length)),
+                ('pattern', '@"{}"'.format(six.ensure_str(pattern))
+                 if pattern else 'nil'),
+            ]))
+        self._string_validator_cache[data_type] = validator
+        return validator
 
     def _determine_validator_type(self, data_type, value, has_default):
         """Returns validator string for given data type, else None."""
@@ -877,10 +1040,8 @@ class ObjCTypesBackend(ObjCBaseBackend):
             validator = '{}:{}'.format(
                 fmt_validator(data_type),
                 fmt_func_args([
-                    ('minItems', '@({})'.format(data_type.min_items)
-                     if data_type.min_items else 'nil'),
-                    ('maxItems', '@({})'.format(data_type.max_items)
-                     if data_type.max_items else 'nil'),
+                    ('minItems', _fmt_boxed_or_nil(data_type.min_items)),
+                    ('maxItems', _fmt_boxed_or_nil(data_type.max_items)),
                     ('itemValidator', item_validator),
                 ]))
         elif is_map_type(data_type):
@@ -898,46 +1059,24 @@ class ObjCTypesBackend(ObjCBaseBackend):
                 validator = '{}:{}'.format(
                     fmt_validator(data_type),
                     fmt_func_args([
-                        ('minValue', '@({})'.format(data_type.min_value)
-                         if data_type.min_value else 'nil'),
-                        ('maxValue', '@({})'.format(data_type.max_value)
-                         if data_type.max_value else 'nil'),
+                        ('minValue', _fmt_boxed_or_nil(data_type.min_value)),
+                        ('maxValue', _fmt_boxed_or_nil(data_type.max_value)),
                     ]))
         elif is_string_type(data_type):
             if data_type.pattern or data_type.min_length or data_type.max_length:
-                pattern = data_type.pattern.encode('unicode_escape').replace(
-                    b"\"",
-                    b"\\\"") if data_type.pattern else None
-                validator = '{}:{}'.format(
-                    fmt_validator(data_type),
-                    fmt_func_args([
-                        ('minLength', '@({})'.format(data_type.min_length)
-                         if data_type.min_length else 'nil'),
-                        ('maxLength', '@({})'.format(data_type.max_length)
-                         if data_type.max_length else 'nil'),
-                        ('pattern', '@"{}"'.format(six.ensure_str(pattern))
-                         if pattern else 'nil'),
-                    ]))
+                validator = self._fmt_string_validator(data_type)
 
         if nullable:
             if validator:
-                validator = fmt_func_call(
-                    caller='DBStoneValidators', callee=validator)
-                validator = fmt_func_call(
-                    caller='DBStoneValidators',
-                    callee='nullableValidator',
-                    args=validator)
+                validator = _nullable_validator_call.format(
+                    _validator_call.format(validator))
         else:
             if validator:
-                validator = fmt_func_call(
-                    caller='DBStoneValidators', callee=validator)
+                validator = _validator_call.format(validator)
             else:
                 validator = 'nil'
             if not has_default:
-                validator = fmt_func_call(
-                    caller='DBStoneValidators',
-                    callee='nonnullValidator',
-                    args=validator)
+                validator = _nonnull_validator_call.format(validator)
             else:
                 validator = None
         return validator
@@ -955,47 +1094,41 @@ class ObjCTypesBackend(ObjCBaseBackend):
             if not struct.all_fields and not struct.has_enumerated_subtypes():
                 self.emit('#pragma unused(valueObj)')
 
-            self.emit(
-                'NSMutableDictionary *jsonDict = [[NSMutableDictionary alloc] init];'
-            )
-            self.emit()
-            for field in struct.all_fields:
-                data_type, nullable = unwrap_nullable(field.data_type)
-
-                input_value = 'valueObj.{}'.format(fmt_var(field.name))
-                serialize_call = self._fmt_serialization_call(
-                    field.data_type, input_value, True)
-
-                if not nullable:
-                    if is_primitive_type(data_type):
-                        self.emit('jsonDict[@"{}"] = {};'.format(
-                            field.name, input_value))
-                    else:
-                        self.emit('jsonDict[@"{}"] = {};'.format(
-                            field.name, serialize_call))
-                else:
-                    with self.block('if ({})'.format(input_value)):
-                        self.emit('jsonDict[@"{}"] = {};'.format(
-                            field.name, serialize_call))
+            if self._struct_serializes_as_literal(struct):
+                # Every key is always present, so build the dictionary in
+                # one step instead of inserting the fields one at a time.
+                entries = ['    @"{}" : valueObj.{},'.format(
+                    field.name, self._struct_field_info(field).name)
+                    for field in struct.all_fields]
+                entries[-1] = entries[-1][:-1]
+                self.emit_lines(
+                    ['NSDictionary *jsonDict = @{'] + entries + ['};'])
+            else:
+                self.emit(
+                    'NSMutableDictionary *jsonDict = [[NSMutableDictionary alloc] init];'
+                )
+                self.emit()
+                lines = []
+                for field in struct.all_fields:
+                    info = self._struct_field_info(field)
+                    lines.extend(self._fmt_json_dict_entry_lines(
+                        field, 'valueObj.{}'.format(info.name),
+                        'value', info.is_nullable))
+                self.emit_lines(lines)
             self.emit()
 
             if struct.has_enumerated_subtypes():
+                base_condition = '{} ([valueObj isKindOfClass:[{} class]])'
                 first_block = True
-                for tags, subtype in struct.get_all_subtypes_with_tags():
-                    assert len(tags) == 1, tags
-                    tag = tags[0]
-                    base_condition = '{} ([valueObj isKindOfClass:[{} class]])'
+                for tag, subtype_name, caller in self._struct_subtypes(struct):
                     with self.block(
                             base_condition.format('if' if first_block else
                                                   'else if',
-                                                  fmt_class_prefix(subtype))):
+                                                  subtype_name)):
                         if first_block:
                             first_block = False
                         func_args = fmt_func_args([('value',
-                            '({} *)valueObj'.format(
-                                fmt_class_prefix(
-                                    subtype)))])
-                        caller = fmt_serial_class(fmt_class_prefix(subtype))
+                            '({} *)valueObj'.format(subtype_name))])
                         serialize_call = fmt_func_call(
                             caller=caller, callee='serialize', args=func_args)
                         self.emit('NSDictionary *subTypeFields = {};'.format(
@@ -1023,20 +1156,20 @@ class ObjCTypesBackend(ObjCBaseBackend):
                 self.emit('#pragma unused(valueDict)')
 
             def emit_struct_deserialize_logic(struct):
-                for field in struct.all_fields:
-                    data_type, nullable = unwrap_nullable(field.data_type)
+                infos = [self._struct_field_info(f) for f in struct.all_fields]
+                for field, info in zip(struct.all_fields, infos):
                     input_value = 'valueDict[@"{}"]'.format(field.name)
+                    is_primitive = is_primitive_type(field.data_type)
 
-                    if is_primitive_type(data_type):
+                    if is_primitive:
                         deserialize_call = input_value
                     else:
                         deserialize_call = self._fmt_serialization_call(
                             field.data_type, input_value, False)
 
-                    if nullable or field.has_default:
-                        default_value = fmt_default_value(
-                            field) if field.has_default else 'nil'
-                        if is_primitive_type(data_type):
+                    if info.is_nullable or info.has_default:
+                        default_value = info.default if info.has_default else 'nil'
+                        if is_primitive:
                             deserialize_call = '{} ?: {}'.format(
                                 input_value, default_value)
                         else:
@@ -1044,13 +1177,11 @@ class ObjCTypesBackend(ObjCBaseBackend):
                                 input_value, deserialize_call, default_value)
 
                     self.emit('{}{} = {};'.format(
-                        fmt_type(field.data_type),
-                        fmt_var(field.name), deserialize_call))
+                        fmt_type(field.data_type), info.name, deserialize_call))
 
                 self.emit()
 
-                deserialized_obj_args = [(fmt_var(f.name), fmt_var(f.name))
-                                         for f in struct.all_fields]
+                deserialized_obj_args = [(info.name, info.name) for info in infos]
                 init_call = fmt_func_call(
                     caller=fmt_alloc_call(caller=struct_name),
                     callee=self._cstor_name_from_fields(struct.all_fields),
@@ -1060,13 +1191,9 @@ class ObjCTypesBackend(ObjCBaseBackend):
             if not struct.has_enumerated_subtypes():
                 emit_struct_deserialize_logic(struct)
             else:
-                for tags, subtype in struct.get_all_subtypes_with_tags():
-                    assert len(tags) == 1, tags
-                    tag = tags[0]
-
-                    base_string = 'if ([valueDict[@".tag"] isEqualToString:@"{}"])'
+                base_string = 'if ([valueDict[@".tag"] isEqualToString:@"{}"])'
+                for tag, _, caller in self._struct_subtypes(struct):
                     with self.block(base_string.format(tag)):
-                        caller = fmt_serial_class(fmt_class_prefix(subtype))
                         args = fmt_func_args([('value', 'valueDict')])
                         deserialize_call = fmt_func_call(
                             caller=caller, callee='deserialize', args=args)
@@ -1077,10 +1204,7 @@ class ObjCTypesBackend(ObjCBaseBackend):
                 if struct.is_catch_all():
                     emit_struct_deserialize_logic(struct)
                 else:
-                    description_str = (
-                        '[NSString stringWithFormat:@"Tag has an invalid '
-                        'value: \\\"%@\\\".", valueDict[@".tag"]]')
-                    self._generate_throw_error('InvalidTag', description_str)
+                    self._generate_throw_error('InvalidTag', _invalid_tag_reason)
         self.emit()
 
     def _generate_union_serializer(self, union):
@@ -1108,34 +1232,17 @@ class ObjCTypesBackend(ObjCBaseBackend):
                         'if' if first_block else 'else if',
                         fmt_camel_upper(field.name))):
                     data_type, nullable = unwrap_nullable(field.data_type)
-                    input_value = 'valueObj.{}'.format(fmt_var(field.name))
-                    serialize_call = self._fmt_serialization_call(
-                        field.data_type, input_value, True)
-
-                    def emit_serializer():
-                        if is_user_defined_type(data_type):
-                            if is_struct_type(data_type) and \
-                                    not data_type.has_enumerated_subtypes():
-                                self.emit('[jsonDict addEntriesFromDictionary:{}];'.
-                                          format(serialize_call))
-                            else:
-                                self.emit(
-                                    'jsonDict[@"{}"] = [{} mutableCopy];'.
-                                    format(field.name, serialize_call))
-                        elif is_primitive_type(data_type):
-                            self.emit('jsonDict[@"{}"] = {};'.format(
-                                field.name, input_value))
-                        else:
-                            self.emit('jsonDict[@"{}"] = {};'.format(
-                                field.name, serialize_call))
-
                     if not is_void_type(data_type):
-                        if not nullable:
-                            emit_serializer()
+                        if not is_user_defined_type(data_type):
+                            kind = 'value'
+                        elif (is_struct_type(data_type) and
+                              not data_type.has_enumerated_subtypes()):
+                            kind = 'flattened'
                         else:
-                            with self.block('if (valueObj.{})'.format(
-                                    fmt_var(field.name))):
-                                emit_serializer()
+                            kind = 'nested'
+                        self.emit_lines(self._fmt_json_dict_entry_lines(
+                            field, 'valueObj.{}'.format(fmt_var(field.name)),
+                            kind, nullable))
 
                     self.emit('jsonDict[@".tag"] = @"{}";'.format(field.name))
 
@@ -1172,9 +1279,9 @@ class ObjCTypesBackend(ObjCBaseBackend):
             self.emit('NSString *tag = valueDict[@".tag"];')
             self.emit()
 
+            base_cond = '{} ([tag isEqualToString:@"{}"])'
             first_block = True
             for field in union.all_fields:
-                base_cond = '{} ([tag isEqualToString:@"{}"])'
                 with self.block(
                         base_cond.format('if' if first_block else 'else if',
                                          field.name)):
@@ -1182,6 +1289,7 @@ class ObjCTypesBackend(ObjCBaseBackend):
                         first_block = False
                     if not is_void_type(field.data_type):
                         data_type, nullable = unwrap_nullable(field.data_type)
+                        field_var = fmt_var(field.name)
                         if is_struct_type(
                                 data_type
                         ) and not data_type.has_enumerated_subtypes():
@@ -1200,10 +1308,9 @@ class ObjCTypesBackend(ObjCBaseBackend):
                                 input_value, deserialize_call)
 
                         self.emit('{}{} = {};'.format(
-                            fmt_type(field.data_type),
-                            fmt_var(field.name), deserialize_call))
-                        deserialized_obj_args = [(fmt_var(field.name),
-                                                  fmt_var(field.name))]
+                            fmt_type(field.data_type), field_var,
+                            deserialize_call))
+                        deserialized_obj_args = [(field_var, field_var)]
                     else:
                         deserialized_obj_args = []
 
@@ -1221,15 +1328,27 @@ class ObjCTypesBackend(ObjCBaseBackend):
                         fmt_func_call(
                             caller=fmt_alloc_call(union_name), callee=callee)))
                 else:
-                    reason = (
-                        '[NSString stringWithFormat:@"Tag has an '
-                        'invalid value: \\\"%@\\\".", valueDict[@".tag"]]')
-                    self._generate_throw_error('InvalidTag', reason)
+                    self._generate_throw_error('InvalidTag', _invalid_tag_reason)
         self.emit()
 
     def _fmt_serialization_call(self, data_type, input_value, serialize, depth=0):
         """Returns the appropriate serialization / deserialization method
-        call for the given data type."""
+        call for the given data type. The result is cached, since the same
+        data types recur across fields, union tags and routes."""
+        key = (data_type, input_value, serialize, depth)
+        try:
+            return self._ser_cache[key]
+        except KeyError:
+            pass
+
+        serialization_call = self._build_serialization_call(
+            data_type, input_value, serialize, depth)
+        self._ser_cache[key] = serialization_call
+        return serialization_call
+
+    def _build_serialization_call(self, data_type, input_value, serialize, depth):
+        """Formats the serialization / deserialization method call for the
+        given data type. Use `_fmt_serialization_call`, which caches this."""
         data_type, _ = unwrap_nullable(data_type)
         serializer_func = 'serialize' if serialize else 'deserialize'
         serializer_args = []
@@ -1283,9 +1402,13 @@ class ObjCTypesBackend(ObjCBaseBackend):
                     self._get_namespace_route_imports(namespace, include_route_args=False), [])
             self._generate_imports_m(imports_classes_m)
 
+            route_names = [fmt_route_var(namespace.name, route)
+                           for route in namespace.routes]
+            namespace_arg = 'namespace_:@\"{}\"'.format(namespace.name)
+            attr_keys = [field.name for field in route_schema.fields]
+
             with self.block_m(fmt_route_obj_class(namespace.name)):
-                for route in namespace.routes:
-                    route_name = fmt_route_var(namespace.name, route)
+                for route_name in route_names:
                     self.emit('static DBRoute *{};'.format(route_name))
                 self.emit()
 
@@ -1304,8 +1427,7 @@ class ObjCTypesBackend(ObjCBaseBackend):
                     self.emit()
                 self.emit()
 
-                for route in namespace.routes:
-                    route_name = fmt_route_var(namespace.name, route)
+                for route, route_name in zip(namespace.routes, route_names):
                     if route.version == 1:
                         route_path = route.name
                     else:
@@ -1358,20 +1480,19 @@ class ObjCTypesBackend(ObjCBaseBackend):
                                             route_name),
                                         delim=(None, None),
                                         after='];'):
-                                    self.emit('@\"{}\"'.format(route_path))
-                                    self.emit('namespace_:@\"{}\"'.format(
-                                        namespace.name))
-                                    self.emit('deprecated:{}'.format(deprecated))
-                                    self.emit('resultType:{}'.format(result_type))
-                                    self.emit('errorType:{}'.format(error_type))
+                                    self.emit_lines([
+                                        '@\"{}\"'.format(route_path),
+                                        namespace_arg,
+                                        'deprecated:{}'.format(deprecated),
+                                        'resultType:{}'.format(result_type),
+                                        'errorType:{}'.format(error_type),
+                                    ])
 
                                     attrs = []
-                                    for field in route_schema.fields:
-                                        attr_key = field.name
-                                        attr_val = ("@\"{}\"".format(route.attrs
-                                                .get(attr_key)) if route.attrs
-                                            .get(attr_key)
-                                            else 'nil')
+                                    for attr_key in attr_keys:
+                                        attr_val = route.attrs.get(attr_key)
+                                        attr_val = ('@\"{}\"'.format(attr_val)
+                                                    if attr_val else 'nil')
                                         attrs.append('@\"{}\": {}'.format(
                                             attr_key, attr_val))
 
@@ -1380,10 +1501,12 @@ class ObjCTypesBackend(ObjCBaseBackend):
                                         delim=('attrs:@{', '}'),
                                         compact=True)
 
-                                    self.emit('dataStructSerialBlock:{}'.format(
-                                        dataStructSerialBlock))
-                                    self.emit('dataStructDeserialBlock:{}'.format(
-                                        dataStructDeserialBlock))
+                                    self.emit_lines([
+                                        'dataStructSerialBlock:{}'.format(
+                                            dataStructSerialBlock),
+                                        'dataStructDeserialBlock:{}'.format(
+                                            dataStructDeserialBlock),
+                                    ])
 
                             self.emit('return {};'.format(route_name))
                         self.emit()
@@ -1486,9 +1609,9 @@ class ObjCTypesBackend(ObjCBaseBackend):
     def _generate_union_tag_state_funcs(self, union):
         """Emits the is<TAG_NAME> methods and tagName method for determining
         tag state and retrieving human-readable value of tag state, respectively."""
-        for field in union.all_fields:
-            enum_field_name = fmt_enum_name(field.name, union)
-
+        enum_field_names = [fmt_enum_name(field.name, union)
+                            for field in union.all_fields]
+        for field, enum_field_name in zip(union.all_fields, enum_field_names):
             with self.block_func(
                     func='is{}'.format(fmt_camel_upper(field.name)),
                     args=[],
@@ -1499,10 +1622,10 @@ class ObjCTypesBackend(ObjCBaseBackend):
         with self.block_func(
                 func='tagName', args=[], return_type='NSString *'):
             with self.block('switch (_tag)'):
-                for field in union.all_fields:
-                    enum_field_name = fmt_enum_name(field.name, union)
-                    self.emit('case {}:'.format(enum_field_name))
-                    self.emit('   return @"{}";'.format(enum_field_name))
+                self.emit_lines(
+                    line.format(enum_field_name)
+                    for enum_field_name in enum_field_names
+                    for line in ('case {}:', '   return @"{}";'))
             self.emit()
             self._generate_throw_error('InvalidTag',
                                        '@"Tag has an unknown value."')
@@ -1603,8 +1726,7 @@ class ObjCTypesBackend(ObjCBaseBackend):
 
     def _generate_throw_error(self, name, reason):
         """Emits a generic error throwing line."""
-        throw_exc = '@throw([NSException exceptionWithName:@"{}" reason:{} userInfo:nil]);'
-        self.emit(throw_exc.format(name, reason))
+        self.emit(_throw_exc.format(name, reason))
 
     def _docf(self, tag, val):
         if tag == 'route':
@@ -1,5 +1,5 @@
-import pprint
 from contextlib import contextmanager
+from functools import lru_cache
 
 from stone.backend import Backend, CodeBackend
 from stone.backends.helpers import (
@@ -42,7 +42,7 @@ _type_table = {
     UInt64: 'int',
 }
 
-_reserved_keywords = {
+_reserved_keywords = frozenset({
     'break',
     'class',
     'continue',
@@ -50,15 +50,14 @@ _reserved_keywords = {
     'pass',
     'while',
     'async',
-}
+})
 
 @contextmanager
 def emit_pass_if_nothing_emitted(codegen):
     # type: (CodeBackend) -> typing.Iterator[None]
     starting_lineno = codegen.lineno
     yield
-    ending_lineno = codegen.lineno
-    if starting_lineno == ending_lineno:
+    if codegen.lineno == starting_lineno:
         codegen.emit("pass")
         codegen.emit()
 
@@ -68,27 +67,41 @@ def _rename_if_reserved(s):
     else:
         return s
 
+@lru_cache(maxsize=4096)
 def fmt_class(name, check_reserved=False):
     s = fmt_pascal(name)
-    return _rename_if_reserved(s) if check_reserved else s
+    return s + '_' if check_reserved and s in _reserved_keywords else s
 
+@lru_cache(maxsize=4096)
 def fmt_func(name, check_reserved=False, version=1):
     name = fmt_underscores(name)
-    if check_reserved:
-        name = _rename_if_reserved(name)
+    if check_reserved and name in _reserved_keywords:
+        name += '_'
     if version > 1:
         name = '{}_v{}'.format(name, version)
     return name
 
 def fmt_obj(o):
+    # pprint's layout engine only changes the output of containers and of
+    # strings it can split on whitespace; everything else is just its repr.
+    if o is None or isinstance(o, (bool, int, float)):
+        return repr(o)
+    if isinstance(o, str) and not any(c.isspace() for c in o):
+        return repr(o)
+    # Only needed for the fallback, so keep it off the import path.
+    import pprint  # pylint: disable=import-outside-toplevel
     return pprint.pformat(o, width=1)
 
 def fmt_type(data_type):
-    return _type_table.get(data_type.__class__, fmt_class(data_type.name))
+    type_name = _type_table.get(data_type.__class__)
+    if type_name is None:
+        type_name = fmt_class(data_type.name)
+    return type_name
 
+@lru_cache(maxsize=4096)
 def fmt_var(name, check_reserved=False):
     s = fmt_underscores(name)
-    return _rename_if_reserved(s) if check_reserved else s
+    return s + '_' if check_reserved and s in _reserved_keywords else s
 
 def fmt_namespaced_var(ns_name, data_type_name, field_name):
     return ".".join([ns_name, data_type_name, fmt_var(field_name)])
@@ -6,7 +6,6 @@ from stone.backends.python_helpers import (
     check_route_name_conflict,
     class_name_for_annotation_type,
     class_name_for_data_type,
-    emit_pass_if_nothing_emitted,
     fmt_func,
     fmt_namespace,
     fmt_var,
@@ -43,9 +42,12 @@ from stone.typing_hacks import cast
 _MYPY = False
 if _MYPY:
     import typing  # noqa: F401 # pylint: disable=import-error,unused-import,useless-suppression
+    from stone.ir import StructField  # noqa: F401 # pylint: disable=unused-import
 
 
 class ImportTracker:
+    __slots__ = ('cur_namespace_typing_imports', 'cur_namespace_adhoc_imports')
+
     def __init__(self):
         # type: () -> None
         self.cur_namespace_typing_imports = set()  # type: typing.Set[typing.Text]
@@ -101,6 +103,10 @@ class PythonTypeStubsBackend(CodeBackend):
         # type: (...) -> None
         super().__init__(*args, **kwargs)
         self._pep_484_type_mapping_callbacks = self._get_pep_484_type_mapping_callbacks()
+        # Maps (namespace, data type) to its PEP 484 type. Cleared with the
+        # import tracker, so the mapping callbacks register the imports needed
+        # by a type the first time it's seen in each namespace.
+        self._pep_484_type_cache = {}  # type: typing.Dict[typing.Tuple, typing.Text]
 
     def generate(self, api):
         # type: (Api) -> None
@@ -121,6 +127,7 @@ class PythonTypeStubsBackend(CodeBackend):
 
         self.cur_namespace = namespace
         self.import_tracker.clear()
+        self._pep_484_type_cache.clear()
         generate_module_header(self)
 
         self.emit_placeholder('imports_needed_for_typing')
@@ -214,9 +221,11 @@ class PythonTypeStubsBackend(CodeBackend):
         # type: (ApiNamespace, Struct) -> None
         """Defines a Python class that represents a struct in Stone."""
         self.emit(self._class_declaration_for_type(ns, data_type))
+        # all_fields rebuilds the inherited field list on each access.
+        fields = data_type.all_fields
         with self.indent():
-            self._generate_struct_class_init(ns, data_type)
-            self._generate_struct_class_properties(ns, data_type)
+            self._generate_struct_class_init(ns, fields)
+            self._generate_struct_class_properties(ns, fields)
             self._generate_struct_or_union_class_custom_annotations()
 
         self._generate_validator_for(data_type)
@@ -232,7 +241,9 @@ class PythonTypeStubsBackend(CodeBackend):
     def _generate_union_class(self, ns, data_type):
         # type: (ApiNamespace, Union) -> None
         self.emit(self._class_declaration_for_type(ns, data_type))
-        with self.indent(), emit_pass_if_nothing_emitted(self):
+        # The custom annotations stub is always emitted, so the class body is
+        # never empty and needs no `pass` guard.
+        with self.indent():
             self._generate_union_class_vars(ns, data_type)
             self._generate_union_class_is_set(data_type)
             self._generate_union_class_variant_creators(ns, data_type)
@@ -248,10 +259,10 @@ class PythonTypeStubsBackend(CodeBackend):
 
         # Generate stubs for class variables so that IDEs like PyCharms have an
         # easier time detecting their existence.
+        field_type = class_name_for_data_type(data_type, ns)
         for field in data_type.fields:
             if is_void_type(field.data_type):
                 field_name = fmt_var(field.name)
-                field_type = class_name_for_data_type(data_type, ns)
                 self.emit('{field_name}: {field_type} = ...'.format(
                     field_name=field_name,
                     field_type=field_type,
@@ -262,10 +273,12 @@ class PythonTypeStubsBackend(CodeBackend):
 
     def _generate_union_class_is_set(self, union):
         # type: (Union) -> None
+        lines = []  # type: typing.List[typing.Text]
         for field in union.fields:
             field_name = fmt_func(field.name)
-            self.emit('def is_{}(self) -> bool: ...'.format(field_name))
-            self.emit()
+            lines.append('def is_{}(self) -> bool: ...'.format(field_name))
+            lines.append('')
+        self.emit_lines(lines)
 
     def _generate_union_class_variant_creators(self, ns, data_type):
         # type: (ApiNamespace, Union) -> None
@@ -276,18 +289,20 @@ class PythonTypeStubsBackend(CodeBackend):
         """
         union_type = class_name_for_data_type(data_type)
 
+        lines = []  # type: typing.List[typing.Text]
         for field in data_type.fields:
             if not is_void_type(field.data_type):
                 field_name_reserved_check = fmt_func(field.name, check_reserved=True)
                 val_type = self.map_stone_type_to_pep484_type(ns, field.data_type)
 
-                self.emit('@classmethod')
-                self.emit('def {field_name}(cls, val: {val_type}) -> {union_type}: ...'.format(
+                lines.append('@classmethod')
+                lines.append('def {field_name}(cls, val: {val_type}) -> {union_type}: ...'.format(
                     field_name=field_name_reserved_check,
                     val_type=val_type,
                     union_type=union_type,
                 ))
-                self.emit()
+                lines.append('')
+        self.emit_lines(lines)
 
     def _generate_union_class_get_helpers(self, ns, data_type):
         # type: (ApiNamespace, Union) -> None
@@ -295,6 +310,7 @@ class PythonTypeStubsBackend(CodeBackend):
         Generates the following section in the 'union Shape' example:
         def get_circle(self) -> float: ...
         """
+        lines = []  # type: typing.List[typing.Text]
         for field in data_type.fields:
             field_name = fmt_func(field.name)
 
@@ -302,11 +318,12 @@ class PythonTypeStubsBackend(CodeBackend):
                 # generate getter for field
                 val_type = self.map_stone_type_to_pep484_type(ns, field.data_type)
 
-                self.emit('def get_{field_name}(self) -> {val_type}: ...'.format(
+                lines.append('def get_{field_name}(self) -> {val_type}: ...'.format(
                     field_name=field_name,
                     val_type=val_type,
                 ))
-                self.emit()
+                lines.append('')
+        self.emit_lines(lines)
 
     def _generate_alias_definition(self, namespace, alias):
         # type: (ApiNamespace, Alias) -> None
@@ -337,10 +354,10 @@ class PythonTypeStubsBackend(CodeBackend):
         return 'class {}({}):'.format(
             class_name_for_data_type(data_type), extends)
 
-    def _generate_struct_class_init(self, ns, struct):
-        # type: (ApiNamespace, Struct) -> None
+    def _generate_struct_class_init(self, ns, fields):
+        # type: (ApiNamespace, typing.List[StructField]) -> None
         args = ["self"]
-        for field in struct.all_fields:
+        for field in fields:
             field_name_reserved_check = fmt_var(field.name, True)
             field_type = self.map_stone_type_to_pep484_type(ns, field.data_type)
 
@@ -354,10 +371,10 @@ class PythonTypeStubsBackend(CodeBackend):
 
         self.generate_multiline_list(args, before='def __init__', after=' -> None: ...')
 
-    def _generate_struct_class_properties(self, ns, struct):
-        # type: (ApiNamespace, Struct) -> None
+    def _generate_struct_class_properties(self, ns, fields):
+        # type: (ApiNamespace, typing.List[StructField]) -> None
         to_emit = []  # type: typing.List[typing.Text]
-        for field in struct.all_fields:
+        for field in fields:
             field_name_reserved_check = fmt_func(field.name, check_reserved=True)
             field_type = self.map_stone_type_to_pep484_type(ns, field.data_type)
 
@@ -365,8 +382,7 @@ class PythonTypeStubsBackend(CodeBackend):
                 "{}: bb.Attribute[{}] = ...".format(field_name_reserved_check, field_type)
             )
 
-        for s in to_emit:
-            self.emit(s)
+        self.emit_lines(to_emit)
 
     def _generate_struct_or_union_class_custom_annotations(self):
         """
@@ -398,25 +414,22 @@ class PythonTypeStubsBackend(CodeBackend):
         def upon_encountering_list(ns, data_type, override_dict):
             # type: (ApiNamespace, DataType, OverrideDefaultTypesDict) -> typing.Text
             self.import_tracker._register_typing_import("List")
-            return "List[{}]".format(
-                map_stone_type_to_python_type(ns, data_type, override_dict)
-            )
+            return "List[" + map_stone_type_to_python_type(ns, data_type, override_dict) + "]"
 
         def upon_encountering_map(ns, map_data_type, override_dict):
             # type: (ApiNamespace, DataType, OverrideDefaultTypesDict) -> typing.Text
             map_type = cast(Map, map_data_type)
             self.import_tracker._register_typing_import("Dict")
-            return "Dict[{}, {}]".format(
-                map_stone_type_to_python_type(ns, map_type.key_data_type, override_dict),
-                map_stone_type_to_python_type(ns, map_type.value_data_type, override_dict)
-            )
+            return ("Dict[" +
+                    map_stone_type_to_python_type(ns, map_type.key_data_type, override_dict) +
+                    ", " +
+                    map_stone_type_to_python_type(ns, map_type.value_data_type, override_dict) +
+                    "]")
 
         def upon_encountering_nullable(ns, data_type, override_dict):
             # type: (ApiNamespace, DataType, OverrideDefaultTypesDict) -> typing.Text
             self.import_tracker._register_typing_import("Optional")
-            return "Optional[{}]".format(
-                map_stone_type_to_python_type(ns, data_type, override_dict)
-            )
+            return "Optional[" + map_stone_type_to_python_type(ns, data_type, override_dict) + "]"
 
         def upon_encountering_timestamp(
                 ns, data_type, override_dict
@@ -444,8 +457,16 @@ class PythonTypeStubsBackend(CodeBackend):
     def map_stone_type_to_pep484_type(self, ns, data_type):
         # type: (ApiNamespace, DataType) -> typing.Text
         assert self._pep_484_type_mapping_callbacks
-        return map_stone_type_to_python_type(ns, data_type,
-                                             override_dict=self._pep_484_type_mapping_callbacks)
+        key = (ns, data_type)
+        try:
+            return self._pep_484_type_cache[key]
+        except KeyError:
+            pass
+
+        pep_484_type = map_stone_type_to_python_type(
+            ns, data_type, override_dict=self._pep_484_type_mapping_callbacks)
+        self._pep_484_type_cache[key] = pep_484_type
+        return pep_484_type
 
     def _generate_routes(
             self,
@@ -471,13 +492,13 @@ class PythonTypeStubsBackend(CodeBackend):
                 self.emit("")
                 self.emit('from typing import (')
                 with self.indent():
-                    for to_import in sorted(self.import_tracker.cur_namespace_typing_imports):
-                        self.emit("{},".format(to_import))
+                    self.emit_lines(
+                        "{},".format(to_import)
+                        for to_import in sorted(self.import_tracker.cur_namespace_typing_imports))
                 self.emit(')')
 
             if self.import_tracker.cur_namespace_adhoc_imports:
                 self.emit("")
-                for to_import in self.import_tracker.cur_namespace_adhoc_imports:
-                    self.emit(to_import)
+                self.emit_lines(self.import_tracker.cur_namespace_adhoc_imports)
 
         self.add_named_placeholder('imports_needed_for_typing', output_buffer.getvalue())
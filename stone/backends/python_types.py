@@ -132,7 +132,8 @@ class PythonTypesBackend(CodeBackend):
         for annotation_type in namespace.annotation_types:
             self._generate_annotation_type_class(namespace, annotation_type)
 
-        for data_type in namespace.linearize_data_types():
+        data_types = namespace.linearize_data_types()
+        for data_type in data_types:
             if isinstance(data_type, Struct):
                 self._generate_struct_class(namespace, data_type)
             elif isinstance(data_type, Union):
@@ -145,7 +146,7 @@ class PythonTypesBackend(CodeBackend):
 
         # Generate the struct->subtype tag mapping at the end so that
         # references to later-defined subtypes don't cause errors.
-        for data_type in namespace.linearize_data_types():
+        for data_type in data_types:
             if is_struct_type(data_type):
                 self._generate_struct_class_reflection_attributes(
                     namespace, data_type)
@@ -157,7 +158,7 @@ class PythonTypesBackend(CodeBackend):
                     namespace, data_type)
                 self._generate_union_class_symbol_creators(data_type)
 
-        for data_type in namespace.linearize_data_types():
+        for data_type in data_types:
             if is_struct_type(data_type):
                 self._generate_struct_attributes_defaults(
                     namespace, data_type)
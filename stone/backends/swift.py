@@ -1,4 +1,5 @@
 from contextlib import contextmanager
+from functools import lru_cache
 import os
 from stone.backend import CodeBackend
 from stone.backends.swift_helpers import (
@@ -90,6 +91,10 @@ class SwiftBaseBackend(CodeBackend):
     """Wrapper class over Stone generator for Swift logic."""
     # pylint: disable=abstract-method
 
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        self._init_args_cache = {}
+
     @contextmanager
     def function_block(self, func, args, return_type=None):
         signature = '{}({})'.format(func, args)
@@ -120,23 +125,26 @@ class SwiftBaseBackend(CodeBackend):
         return sep.join(out)
 
     def _struct_init_args(self, data_type, namespace=None):  # pylint: disable=unused-argument
-        args = []
-        for field in data_type.all_fields:
-            name = fmt_var(field.name)
-            value = fmt_type(field.data_type)
-            data_type, nullable = unwrap_nullable(field.data_type)
-
-            if field.has_default:
-                if is_union_type(data_type):
-                    default = '.{}'.format(fmt_var(field.default.tag_name))
-                else:
-                    default = fmt_obj(field.default)
-                value += ' = {}'.format(default)
-            elif nullable:
-                value += ' = nil'
-            arg = (name, value)
-            args.append(arg)
-        return args
+        try:
+            args = self._init_args_cache[data_type]
+        except KeyError:
+            args = self._init_args_cache[data_type] = tuple(
+                (fmt_var(field.name), self._fmt_init_arg_value(field))
+                for field in data_type.all_fields)
+        # Callers append client-side args to the result, so hand out a copy.
+        return list(args)
+
+    def _fmt_init_arg_value(self, field):
+        value = fmt_type(field.data_type)
+        data_type, nullable = unwrap_nullable(field.data_type)
+
+        if field.has_default:
+            if is_union_type(data_type):
+                return '{} = .{}'.format(value, fmt_var(field.default.tag_name))
+            return '{} = {}'.format(value, fmt_obj(field.default))
+        if nullable:
+            return value + ' = nil'
+        return value
 
     def _objc_init_args(self, data_type, include_defaults=True):
         args = []
@@ -265,14 +273,32 @@ class SwiftBaseBackend(CodeBackend):
         else:
             return val
 
-    def _write_output_in_target_folder(self, output, file_name):
+    def _output_path_in_target_folder(self, file_name):
         full_path = self.target_folder_path
         if not os.path.exists(full_path):
             os.mkdir(full_path)
-        full_path = os.path.join(full_path, file_name)
-        with open(full_path, "w", encoding='utf-8') as fh:
+        return os.path.join(full_path, file_name)
+
+    def _write_output_in_target_folder(self, output, file_name):
+        with open(self._output_path_in_target_folder(file_name), "w", encoding='utf-8') as fh:
             fh.write(output)
 
+    def _stream_output_in_target_folder(self, chunks, file_name):
+        """Writes the chunks of a rendered template as they are produced, so
+        the whole file is never held in memory as one string. They go to a
+        temporary file that only replaces the target once rendering succeeds,
+        so a template error never leaves a truncated file behind."""
+        full_path = self._output_path_in_target_folder(file_name)
+        tmp_path = os.path.join(self.target_folder_path, '.{}.tmp'.format(file_name))
+        try:
+            with open(tmp_path, "w", encoding='utf-8') as fh:
+                fh.writelines(chunks)
+            os.replace(tmp_path, full_path)
+        finally:
+            if os.path.exists(tmp_path):
+                os.remove(tmp_path)
+
+@lru_cache(maxsize=4096)
 def fmt_serial_type(data_type):
     data_type, nullable = unwrap_nullable(data_type)
 
@@ -281,7 +307,9 @@ def fmt_serial_type(data_type):
         result = result.format(fmt_class(data_type.namespace.name),
             fmt_class(data_type.name))
     else:
-        result = _serial_type_table.get(data_type.__class__, fmt_class(data_type.name))
+        result = _serial_type_table.get(data_type.__class__)
+        if result is None:
+            result = fmt_class(data_type.name)
 
         if is_list_type(data_type):
             result = result + '<{}>'.format(fmt_serial_type(data_type.data_type))
@@ -292,6 +320,7 @@ def fmt_serial_type(data_type):
     return result if not nullable else 'NullableSerializer'
 
 
+@lru_cache(maxsize=4096)
 def fmt_serial_obj(data_type):
     data_type, nullable = unwrap_nullable(data_type)
 
@@ -300,7 +329,9 @@ def fmt_serial_obj(data_type):
         result = result.format(fmt_class(data_type.namespace.name),
             fmt_class(data_type.name))
     else:
-        result = _serial_type_table.get(data_type.__class__, fmt_class(data_type.name))
+        result = _serial_type_table.get(data_type.__class__)
+        if result is None:
+            result = fmt_class(data_type.name)
 
         if is_list_type(data_type):
             result = result + '({})'.format(fmt_serial_obj(data_type.data_type))
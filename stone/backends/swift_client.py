@@ -216,18 +216,18 @@ class SwiftBackend(SwiftBaseBackend):
             template = self._jinja_template("ObjCRoutes.jinja")
             template.globals = template_globals
 
-            output_from_parsed_template = template.render(namespace=namespace)
+            output_from_parsed_template = template.generate(namespace=namespace)
 
-            self._write_output_in_target_folder(output_from_parsed_template,
-                                                'DBX{}Routes.swift'.format(ns_class))
+            self._stream_output_in_target_folder(output_from_parsed_template,
+                                                 'DBX{}Routes.swift'.format(ns_class))
         else:
             template = self._jinja_template("SwiftRoutes.jinja")
             template.globals = template_globals
 
-            output_from_parsed_template = template.render(namespace=namespace)
+            output_from_parsed_template = template.generate(namespace=namespace)
 
-            self._write_output_in_target_folder(output_from_parsed_template,
-                                                '{}Routes.swift'.format(ns_class))
+            self._stream_output_in_target_folder(output_from_parsed_template,
+                                                 '{}Routes.swift'.format(ns_class))
 
     def _generate_request_boxes(self, api):
         background_compatible_routes = self._background_compatible_namespace_route_pairs(api)
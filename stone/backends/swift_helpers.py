@@ -1,4 +1,4 @@
-import pprint
+from functools import lru_cache
 
 from stone.ir import (
     Boolean,
@@ -62,10 +62,10 @@ _objc_type_table = {
     Void: '',
 }
 
-_reserved_words = {
+_reserved_words = frozenset({
     'description',
     'bool',
-    'nsdata'
+    'nsdata',
     'float',
     'double',
     'int32',
@@ -99,7 +99,7 @@ _reserved_words = {
     'default',
     'hash',
     'client',
-}
+})
 
 
 def fmt_obj(o):
@@ -110,14 +110,14 @@ def fmt_obj(o):
         return 'false'
     if o is None:
         return 'nil'
-    if o == '':
-        return '""'
-    elif isinstance(o, str):
+    if isinstance(o, str):
         return '"{}"'.format(o)
-
-    return pprint.pformat(o, width=1)
+    # Field defaults are the only literals formatted here, so anything left
+    # is a number.
+    return repr(o)
 
 
+@lru_cache(maxsize=4096)
 def _format_camelcase(name, lower_first=True):
     words = [word.capitalize() for word in split_words(name)]
     if lower_first:
@@ -139,6 +139,7 @@ def fmt_func(name, version):
     return name
 
 
+@lru_cache(maxsize=4096)
 def fmt_type(data_type):
     data_type, nullable = unwrap_nullable(data_type)
 
@@ -146,7 +147,9 @@ def fmt_type(data_type):
         result = '{}.{}'.format(fmt_class(data_type.namespace.name),
                                 fmt_class(data_type.name))
     else:
-        result = _type_table.get(data_type.__class__, fmt_class(data_type.name))
+        result = _type_table.get(data_type.__class__)
+        if result is None:
+            result = fmt_class(data_type.name)
 
         if is_list_type(data_type):
             result = result + '<{}>'.format(fmt_type(data_type.data_type))
@@ -156,6 +159,7 @@ def fmt_type(data_type):
 
     return result if not nullable else result + '?'
 
+@lru_cache(maxsize=4096)
 def fmt_objc_type(data_type, allow_nullable=True):
     data_type, nullable = unwrap_nullable(data_type)
 
@@ -163,7 +167,9 @@ def fmt_objc_type(data_type, allow_nullable=True):
         result = 'DBX{}{}'.format(fmt_class(data_type.namespace.name),
                                 fmt_class(data_type.name))
     else:
-        result = _objc_type_table.get(data_type.__class__, fmt_class(data_type.name))
+        result = _objc_type_table.get(data_type.__class__)
+        if result is None:
+            result = fmt_class(data_type.name)
 
         if is_list_type(data_type):
             result = result + '<{}>'.format(fmt_objc_type(data_type.data_type, False))
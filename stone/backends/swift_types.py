@@ -1,6 +1,7 @@
 import json
 import os
 import shutil
+from functools import lru_cache
 
 import six
 import jinja2
@@ -32,9 +33,16 @@ from stone.backends.swift_helpers import (
 )
 
 from stone.ir import (
+    Float32,
+    Float64,
+    Int32,
+    Int64,
+    List,
+    String,
+    UInt32,
+    UInt64,
     is_list_type,
     is_numeric_type,
-    is_string_type,
     is_struct_type,
     is_union_type,
     is_void_type,
@@ -70,6 +78,14 @@ _cmdline_parser.add_argument(
     help=('Sets whether documentation is generated.'),
 )
 
+
+@lru_cache(maxsize=4096)
+def _fmt_pattern(pattern):
+    """Returns the regex pattern as a quoted Swift string literal."""
+    escaped = pattern.encode('unicode_escape').replace(b"\"", b"\\\"")
+    return '"{}"'.format(six.ensure_str(escaped))
+
+
 class SwiftTypesBackend(SwiftBaseBackend):
     """
     Generates Swift modules to represent the input Stone spec.
@@ -136,6 +152,21 @@ class SwiftTypesBackend(SwiftBaseBackend):
     """
 
     cmdline_parser = _cmdline_parser
+
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        numeric_validator = self._numeric_validator
+        self._validator_builders = {
+            Float32: numeric_validator,
+            Float64: numeric_validator,
+            Int32: numeric_validator,
+            Int64: numeric_validator,
+            List: self._list_validator,
+            String: self._string_validator,
+            UInt32: numeric_validator,
+            UInt64: numeric_validator,
+        }
+
     def generate(self, api):
         rsrc_folder = os.path.join(os.path.dirname(__file__), 'swift_rsrc')
         if not self.args.objc:
@@ -206,15 +237,15 @@ class SwiftTypesBackend(SwiftBaseBackend):
             ns_class = fmt_class(namespace.name)
 
             if self.args.objc:
-                objc_output = objc_template.render(namespace=namespace,
-                                                   route_schema=api.route_schema)
-                self._write_output_in_target_folder(objc_output,
-                                                    'DBX{}.swift'.format(ns_class))
-            else:
-                swift_output = swift_template.render(namespace=namespace,
+                objc_output = objc_template.generate(namespace=namespace,
                                                      route_schema=api.route_schema)
-                self._write_output_in_target_folder(swift_output,
-                                                    '{}.swift'.format(ns_class))
+                self._stream_output_in_target_folder(objc_output,
+                                                     'DBX{}.swift'.format(ns_class))
+            else:
+                swift_output = swift_template.generate(namespace=namespace,
+                                                       route_schema=api.route_schema)
+                self._stream_output_in_target_folder(swift_output,
+                                                     '{}.swift'.format(ns_class))
         if self.args.documentation:
             self._generate_jazzy_docs(api)
 
@@ -277,43 +308,44 @@ class SwiftTypesBackend(SwiftBaseBackend):
 
     def _determine_validator_type(self, data_type, value):
         data_type, nullable = unwrap_nullable(data_type)
-        if is_list_type(data_type):
-            item_validator = self._determine_validator_type(data_type.data_type, value)
-            if item_validator:
-                v = "arrayValidator({})".format(
-                    self._func_args([
-                        ("minItems", data_type.min_items),
-                        ("maxItems", data_type.max_items),
-                        ("itemValidator", item_validator),
-                    ])
-                )
-            else:
-                return None
-        elif is_numeric_type(data_type):
-            v = "comparableValidator({})".format(
-                self._func_args([
-                    ("minValue", data_type.min_value),
-                    ("maxValue", data_type.max_value),
-                ])
-            )
-        elif is_string_type(data_type):
-            pat = data_type.pattern if data_type.pattern else None
-            pat = pat.encode('unicode_escape').replace(b"\"",
-                                                       b"\\\"") if pat else pat
-            v = "stringValidator({})".format(
-                self._func_args([
-                    ("minLength", data_type.min_length),
-                    ("maxLength", data_type.max_length),
-                    ("pattern", '"{}"'.format(six.ensure_str(pat)) if pat else None),
-                ])
-            )
-        else:
+        build_validator = self._validator_builders.get(data_type.__class__)
+        if build_validator is None:
             return None
-
-        if nullable:
+        v = build_validator(data_type, value)
+        if v and nullable:
             v = "nullableValidator({})".format(v)
         return v
 
+    def _list_validator(self, data_type, value):
+        item_validator = self._determine_validator_type(data_type.data_type, value)
+        if not item_validator:
+            return None
+        return "arrayValidator({})".format(
+            self._func_args([
+                ("minItems", data_type.min_items),
+                ("maxItems", data_type.max_items),
+                ("itemValidator", item_validator),
+            ])
+        )
+
+    def _numeric_validator(self, data_type, value):  # pylint: disable=unused-argument
+        return "comparableValidator({})".format(
+            self._func_args([
+                ("minValue", data_type.min_value),
+                ("maxValue", data_type.max_value),
+            ])
+        )
+
+    def _string_validator(self, data_type, value):  # pylint: disable=unused-argument
+        pat = data_type.pattern
+        return "stringValidator({})".format(
+            self._func_args([
+                ("minLength", data_type.min_length),
+                ("maxLength", data_type.max_length),
+                ("pattern", _fmt_pattern(pat) if pat else None),
+            ])
+        )
+
     def _format_tag_type(self, data_type):
         if is_void_type(data_type):
             return ''
@@ -2,6 +2,7 @@ from collections import OrderedDict
 
 
 class ASTNode:
+    __slots__ = ('path', 'lineno', 'lexpos')
 
     def __init__(self, path, lineno, lexpos):
         """
@@ -17,6 +18,7 @@ class ASTNode:
 
 
 class AstNamespace(ASTNode):
+    __slots__ = ('name', 'doc')
 
     def __init__(self, path, lineno, lexpos, name, doc):
         """
@@ -36,6 +38,7 @@ class AstNamespace(ASTNode):
 
 
 class AstImport(ASTNode):
+    __slots__ = ('target',)
 
     def __init__(self, path, lineno, lexpos, target):
         """
@@ -52,6 +55,7 @@ class AstImport(ASTNode):
         return 'AstImport({!r})'.format(self.target)
 
 class AstAlias(ASTNode):
+    __slots__ = ('name', 'type_ref', 'doc', 'annotations')
 
     def __init__(self, path, lineno, lexpos, name, type_ref, doc):
         """
@@ -73,6 +77,7 @@ class AstAlias(ASTNode):
         return 'AstAlias({!r}, {!r})'.format(self.name, self.type_ref)
 
 class AstTypeDef(ASTNode):
+    __slots__ = ('name', 'extends', 'doc', 'fields', 'examples')
 
     def __init__(self, path, lineno, lexpos, name, extends, doc, fields,
                  examples):
@@ -109,6 +114,7 @@ class AstTypeDef(ASTNode):
         )
 
 class AstStructDef(AstTypeDef):
+    __slots__ = ('subtypes',)
 
     def __init__(self, path, lineno, lexpos, name, extends, doc, fields,
                  examples, subtypes=None):
@@ -134,6 +140,7 @@ class AstStructDef(AstTypeDef):
         )
 
 class AstStructPatch(ASTNode):
+    __slots__ = ('name', 'fields', 'examples')
 
     def __init__(self, path, lineno, lexpos, name, fields, examples):
         super().__init__(path, lineno, lexpos)
@@ -151,6 +158,7 @@ class AstStructPatch(ASTNode):
         )
 
 class AstUnionDef(AstTypeDef):
+    __slots__ = ('closed',)
 
     def __init__(self, path, lineno, lexpos, name, extends, doc, fields,
                  examples, closed=False):
@@ -173,6 +181,7 @@ class AstUnionDef(AstTypeDef):
         )
 
 class AstUnionPatch(ASTNode):
+    __slots__ = ('name', 'fields', 'examples', 'closed')
 
     def __init__(self, path, lineno, lexpos, name, fields, examples, closed):
         super().__init__(path, lineno, lexpos)
@@ -192,6 +201,7 @@ class AstUnionPatch(ASTNode):
         )
 
 class AstTypeRef(ASTNode):
+    __slots__ = ('name', 'args', 'nullable', 'ns')
 
     def __init__(self, path, lineno, lexpos, name, args, nullable, ns):
         """
@@ -217,6 +227,7 @@ class AstTypeRef(ASTNode):
         )
 
 class AstTagRef(ASTNode):
+    __slots__ = ('tag',)
 
     def __init__(self, path, lineno, lexpos, tag):
         """
@@ -232,6 +243,7 @@ class AstTagRef(ASTNode):
         )
 
 class AstAnnotationRef(ASTNode):
+    __slots__ = ('annotation', 'ns')
 
     def __init__(self, path, lineno, lexpos, annotation, ns):
         """
@@ -248,6 +260,7 @@ class AstAnnotationRef(ASTNode):
         )
 
 class AstAnnotationDef(ASTNode):
+    __slots__ = ('name', 'annotation_type', 'annotation_type_ns', 'args', 'kwargs')
 
     def __init__(self, path, lineno, lexpos, name, annotation_type,
                  annotation_type_ns, args, kwargs):
@@ -277,6 +290,7 @@ class AstAnnotationDef(ASTNode):
         )
 
 class AstAnnotationTypeDef(ASTNode):
+    __slots__ = ('name', 'doc', 'params')
 
     def __init__(self, path, lineno, lexpos, name, doc, params):
         """
@@ -304,6 +318,8 @@ class AstField(ASTNode):
     TODO(kelkabany): Split this into two different classes.
     """
 
+    __slots__ = ('name', 'type_ref', 'doc', 'has_default', 'default', 'annotations')
+
     def __init__(self, path, lineno, lexpos, name, type_ref):
         """
         Args:
@@ -336,6 +352,7 @@ class AstField(ASTNode):
         )
 
 class AstVoidField(ASTNode):
+    __slots__ = ('name', 'doc', 'annotations')
 
     def __init__(self, path, lineno, lexpos, name):
         super().__init__(path, lineno, lexpos)
@@ -359,6 +376,7 @@ class AstVoidField(ASTNode):
         )
 
 class AstSubtypeField(ASTNode):
+    __slots__ = ('name', 'type_ref')
 
     def __init__(self, path, lineno, lexpos, name, type_ref):
         super().__init__(path, lineno, lexpos)
@@ -372,6 +390,16 @@ class AstSubtypeField(ASTNode):
         )
 
 class AstRouteDef(ASTNode):
+    __slots__ = (
+        'name',
+        'version',
+        'deprecated',
+        'arg_type_ref',
+        'result_type_ref',
+        'error_type_ref',
+        'doc',
+        'attrs',
+    )
 
     def __init__(self, path, lineno, lexpos, name, version, deprecated,
                  arg_type_ref, result_type_ref, error_type_ref=None):
@@ -392,6 +420,7 @@ class AstRouteDef(ASTNode):
         self.attrs = attrs
 
 class AstAttrField(ASTNode):
+    __slots__ = ('name', 'value')
 
     def __init__(self, path, lineno, lexpos, name, value):
         super().__init__(path, lineno, lexpos)
@@ -405,6 +434,7 @@ class AstAttrField(ASTNode):
         )
 
 class AstExample(ASTNode):
+    __slots__ = ('label', 'text', 'fields')
 
     def __init__(self, path, lineno, lexpos, label, text, fields):
         super().__init__(path, lineno, lexpos)
@@ -420,6 +450,7 @@ class AstExample(ASTNode):
         )
 
 class AstExampleField(ASTNode):
+    __slots__ = ('name', 'value')
 
     def __init__(self, path, lineno, lexpos, name, value):
         super().__init__(path, lineno, lexpos)
@@ -433,6 +464,7 @@ class AstExampleField(ASTNode):
         )
 
 class AstExampleRef(ASTNode):
+    __slots__ = ('label',)
 
     def __init__(self, path, lineno, lexpos, label):
         super().__init__(path, lineno, lexpos)
@@ -1,5 +1,6 @@
 import logging
 import os
+import sys
 
 import ply.lex as lex
 
@@ -45,9 +46,18 @@ class Lexer:
 
         :param str file_data: Contents of the file to lex.
         """
-        self.lex = lex.lex(module=self, **kwargs)
+        if self.lex is None or kwargs:
+            self.lex = lex.lex(module=self, **kwargs)
+        else:
+            # Reuse the compiled lexer, restoring the state a fresh one
+            # starts in.
+            self.lex.lineno = 1
+            self.lex.lexstatestack = []
+            self.lex.begin('INITIAL')
         self.tokens_queue = []
         self.cur_indent = 0
+        self.last_token = None
+        self.errors = []
         # Hack to avoid tokenization bugs caused by files that do not end in a
         # new line.
         self.lex.input(file_data + '\n')
@@ -234,6 +244,9 @@ class Lexer:
             token.type = self.RESERVED.get(token.value, 'KEYWORD')
             return token
         else:
+            # Identifiers become type, field and route names that are used as
+            # dict keys throughout the IR generator and the backend caches.
+            token.value = sys.intern(token.value)
             return token
 
     def t_ANY_PATH(self, token):
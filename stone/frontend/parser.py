@@ -32,6 +32,11 @@ from .lexer import (
 
 logger = logging.getLogger('stone.frontend.parser')
 
+# The LALR tables generated by yacc.yacc(), as (action, goto, productions).
+# Generating them costs far more than parsing a typical spec, and they only
+# depend on the grammar, so they are shared by every non-debug ParserFactory.
+_lr_tables = None
+
 
 class ParserFactory:
     """
@@ -55,7 +60,7 @@ class ParserFactory:
 
     def __init__(self, debug=False):
         self.debug = debug
-        self.yacc = yacc.yacc(module=self, debug=self.debug, write_tables=self.debug)
+        self.yacc = self._build_yacc()
         self.lexer = Lexer()
         # [(token type, token value, line number), ...]
         self.errors = []
@@ -66,6 +71,33 @@ class ParserFactory:
         self.anony_defs = []
         self.exhausted = True
 
+    def _build_yacc(self):
+        """
+        Returns a ply.yacc parser bound to this factory's rule methods. Only
+        the grammar tables are shared between factories; the parser and the
+        productions it calls back into are always per instance.
+        """
+        global _lr_tables  # pylint: disable=global-statement
+        if self.debug:
+            # Always regenerate so that the debug output and tables are written.
+            return yacc.yacc(module=self, debug=True, write_tables=True)
+        if _lr_tables is None:
+            parser = yacc.yacc(module=self, debug=False, write_tables=False)
+            _lr_tables = (
+                parser.action,
+                parser.goto,
+                tuple((p.str, p.name, p.len, p.func, p.file, p.line)
+                      for p in parser.productions),
+            )
+            return parser
+        lr = yacc.LRTable()
+        lr.lr_action, lr.lr_goto, productions = _lr_tables
+        lr.lr_productions = [yacc.MiniProduction(*p) for p in productions]
+        lr.lr_method = 'LALR'
+        lr.bind_callables(
+            {p.func: getattr(self, p.func) for p in lr.lr_productions if p.func})
+        return yacc.LRParser(lr, self.p_error)
+
     def get_parser(self):
         """
         Returns a ParserFactory with the state reset so it can be used to
@@ -87,6 +119,7 @@ class ParserFactory:
         """
         assert not self.exhausted, 'Must call get_parser() to reset state.'
         self.path = path
+        self.errors = []
         parsed_data = self.yacc.parse(data, lexer=self.lexer, debug=self.debug)
         # It generally makes sense for lexer errors to come first, because
         # those can be the root of parser errors. Also, since we only show one
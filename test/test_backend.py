@@ -95,6 +95,13 @@ hello
         self.assertEqual(t.output_buffer_to_string(), expected)
         t.clear_output_buffer()
 
+        # Check that emit_lines matches a sequence of emits
+        with t.indent():
+            t.emit_lines(['hello', '', 'world'])
+        self.assertEqual(t.output_buffer_to_string(), '    hello\n\n    world\n')
+        t.clear_output_buffer()
+        self.assertRaises(AssertionError, lambda: t.emit_lines(['hello\n']))
+
         # --------------------------------------------------------
         # Check text wrapping emitter
 
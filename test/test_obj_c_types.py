@@ -0,0 +1,87 @@
+import textwrap
+import unittest
+
+from stone.backends.obj_c_types import ObjCTypesBackend
+from stone.frontend.frontend import specs_to_ir
+
+MYPY = False
+if MYPY:
+    import typing  # noqa: F401 # pylint: disable=import-error,unused-import,useless-suppression
+
+
+class TestGeneratedObjCTypes(unittest.TestCase):
+
+    @classmethod
+    def setUpClass(cls):
+        text = textwrap.dedent("""\
+            namespace files
+
+            struct Dimensions
+                height UInt64
+                width UInt64
+
+            struct Photo
+                caption String?
+                taken Boolean
+
+            struct Media
+                union
+                    image Image
+                size UInt64
+
+            struct Image extends Media
+                "A picture."
+            """)
+        api = specs_to_ir([('test.stone', text)])
+        cls.ns = api.namespaces['files']
+
+    def _evaluate_struct_serializer(self, struct_name):
+        # type: (typing.Text) -> typing.Text
+        backend = ObjCTypesBackend(
+            target_folder_path='output',
+            args=['-r', 'DBClient.{ns}.{route}'])
+        backend._generate_struct_serializer(self.ns.data_type_by_name[struct_name])
+        return backend.output_buffer_to_string()
+
+    def test_struct_serializer_primitive_fields(self):
+        # type: () -> None
+        result = self._evaluate_struct_serializer('Dimensions')
+        expected = textwrap.dedent("""\
+            + (NSDictionary<NSString *, id> *)serialize:(DBFILESDimensions *)valueObj {
+                NSDictionary *jsonDict = @{
+                    @"height" : valueObj.height,
+                    @"width" : valueObj.width
+                };
+
+                return jsonDict;
+            }
+
+            """)
+        self.assertEqual(result, expected)
+
+    def test_struct_serializer_nullable_field(self):
+        # type: () -> None
+        result = self._evaluate_struct_serializer('Photo')
+        expected = textwrap.dedent("""\
+            + (NSDictionary<NSString *, id> *)serialize:(DBFILESPhoto *)valueObj {
+                NSMutableDictionary *jsonDict = [[NSMutableDictionary alloc] init];
+
+                jsonDict[@"taken"] = valueObj.taken;
+                if (valueObj.caption) {
+                    jsonDict[@"caption"] = valueObj.caption;
+                }
+
+                return jsonDict;
+            }
+
+            """)
+        self.assertEqual(result, expected)
+
+    def test_struct_serializer_enumerated_subtypes(self):
+        # type: () -> None
+        result = self._evaluate_struct_serializer('Media')
+        self.assertIn(
+            'NSMutableDictionary *jsonDict = [[NSMutableDictionary alloc] init];',
+            result)
+        self.assertNotIn('NSDictionary *jsonDict = @{', result)
+        self.assertIn('jsonDict[@".tag"] = @"image";', result)
@@ -1,5 +1,7 @@
+import pprint
 import textwrap
 
+from stone.backends.python_helpers import fmt_obj
 from stone.backends.python_types import PythonTypesBackend
 from stone.ir import (
     AnnotationType,
@@ -274,4 +276,10 @@ class TestGeneratedPythonTypes(unittest.TestCase):
         ''')
         self.assertEqual(result, expected)
 
+    def test_fmt_obj(self):
+        # type: () -> None
+        for value in [None, True, False, 0, -3, 2**64, 1.5, '', 'abc', "it's",
+                      'two words', 'line\nbreak', [1, 2], {'a': 1}]:
+            self.assertEqual(fmt_obj(value), pprint.pformat(value, width=1))
+
     # TODO: add more unit tests for client code generation
@@ -34,8 +34,11 @@ class TestStone(unittest.TestCase):
     Tests the Stone format.
     """
 
-    def setUp(self):
-        self.parser_factory = ParserFactory(debug=False)
+    @classmethod
+    def setUpClass(cls):
+        # Building the parser tables dominates the cost of these tests, and
+        # get_parser() resets all per-parse state, so share one factory.
+        cls.parser_factory = ParserFactory(debug=False)
 
     def test_namespace_decl(self):
         text = textwrap.dedent("""\
@@ -55,6 +58,34 @@ class TestStone(unittest.TestCase):
         self.assertIsInstance(out[0], AstNamespace)
         self.assertEqual(out[0].name, 'files')
 
+    def test_parser_factories_are_independent(self):
+        # Factories share the grammar tables built from PLY's internals but
+        # not any parse state, so parsing a broken spec at one path leaves
+        # another factory's path, errors, and results untouched.
+        text = textwrap.dedent("""\
+            namespace files
+
+            struct S
+                f String
+            """)
+        bad_text = textwrap.dedent("""\
+            namespace files
+
+            struct S
+              f String
+            """)
+        other_factory = ParserFactory(debug=False)
+        out = other_factory.get_parser().parse(text, path='other.stone')
+        self.parser_factory.get_parser().parse(bad_text, path='bad.stone')
+        self.assertEqual(self.parser_factory.path, 'bad.stone')
+        self.assertNotEqual(self.parser_factory.errors, [])
+        self.assertEqual(other_factory.path, 'other.stone')
+        self.assertEqual(other_factory.errors, [])
+        self.assertIsInstance(out[0], AstNamespace)
+        self.assertEqual(out[1].name, 'S')
+        self.assertEqual(out[1].path, 'other.stone')
+        self.assertEqual(out[1].fields[0].path, 'other.stone')
+
     def test_comments(self):
         text = textwrap.dedent("""\
             # comment at top
@@ -220,7 +251,7 @@ class TestStone(unittest.TestCase):
                 "The space quota info for a user."
                 quota UInt64
                     "The user's total quota allocation (bytes)."
-            """)
+            """).rstrip('\n')
         out = self.parser_factory.get_parser().parse(text)
         self.assertEqual(out[1].name, 'QuotaInfo')
         self.assertEqual(out[1].doc, 'The space quota info for a user.')
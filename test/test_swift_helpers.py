@@ -0,0 +1,23 @@
+import unittest
+
+from stone.backends.swift_helpers import (
+    fmt_class,
+    fmt_func,
+    fmt_var,
+)
+
+
+class TestSwiftHelpers(unittest.TestCase):
+
+    def test_reserved_words_are_escaped(self):
+        # type: () -> None
+        for name in ('description', 'bool', 'nsdata', 'float', 'double'):
+            self.assertEqual(fmt_var(name), name + '_')
+        self.assertEqual(fmt_func('float', 1), 'float_')
+        self.assertEqual(fmt_class('float'), 'Float_')
+
+    def test_other_words_are_not_escaped(self):
+        # type: () -> None
+        self.assertEqual(fmt_var('nsdata_float'), 'nsdataFloat')
+        self.assertEqual(fmt_var('floating'), 'floating')
+        self.assertEqual(fmt_class('file_metadata'), 'FileMetadata')